@@ -12,18 +12,22 @@ The Jishaku cog base, which contains most of the actual functionality of Jishaku
 """
 
 import dataclasses
-import inspect
 import os
 import sys
 import typing
 
-ENABLED_SYMBOLS = ("true", "t", "yes", "y", "on", "1")
-DISABLED_SYMBOLS = ("false", "f", "no", "n", "off", "0")
+ENABLED_SYMBOLS = frozenset(("true", "t", "yes", "y", "on", "1"))
+DISABLED_SYMBOLS = frozenset(("false", "f", "no", "n", "off", "0"))
+
+_SENTINEL = object()
 
 FlagHandler = typing.Optional[typing.Callable[['FlagMeta'], typing.Any]]
 
+# slots support for dataclasses was added in 3.10; older versions fall back to a regular __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
 class Flag:
     """
     Dataclass that represents a Jishaku flag state. Only for internal use.
@@ -33,31 +37,53 @@ class Flag:
     flag_type: type
     default: typing.Callable = None
     override: typing.Any = None
+    _env_key: str = dataclasses.field(init=False, repr=False, compare=False)
+    _cached: typing.Any = dataclasses.field(default=_SENTINEL, init=False, repr=False, compare=False)
+    _default_callable: bool = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._env_key = f"JISHAKU_{self.name}"
+        self._default_callable = callable(self.default) and not isinstance(self.default, type)
 
     def resolve(self, flags):
         """
         Resolve this flag. Only for internal use.
+
+        The result is cached after the first resolution, so changes to the
+        environment after this point are not picked up until FlagMeta.clear_cache
+        is called. Flags with a callable default are re-resolved after any flag
+        is assigned, as their value may depend on other flags.
         """
 
         # Manual override, ignore environment in this case
         if self.override is not None:
             return self.override
 
+        if self._cached is not _SENTINEL:
+            return self._cached
+
+        value = self._resolve_uncached(flags)
+        self._cached = value
+        return value
+
+    def _resolve_uncached(self, flags):
         # Resolve from environment
-        env_value = os.getenv(f"JISHAKU_{self.name}", "").strip()
+        env_value = os.environ.get(self._env_key, "").strip()
 
         if env_value:
             if self.flag_type is bool:
-                if env_value.lower() in ENABLED_SYMBOLS:
+                env_value = env_value.lower()
+
+                if env_value in ENABLED_SYMBOLS:
                     return True
-                if env_value.lower() in DISABLED_SYMBOLS:
+                if env_value in DISABLED_SYMBOLS:
                     return False
             else:
                 return self.flag_type(env_value)
 
         # Fallback if no resolvation from environment
         if self.default is not None:
-            if inspect.isfunction(self.default):
+            if self._default_callable:
                 return self.default(flags)
 
             return self.default
@@ -118,10 +144,53 @@ class FlagMeta(type):
         return super(FlagMeta, cls).__new__(cls, name, base, attrs)
 
     def __getattr__(cls, name: str):
-        if hasattr(cls, 'flag_map') and name in cls.flag_map:
-            return cls.flag_map[name].resolve(cls)
+        # Only reached when normal lookup fails, so flag_map is the only place left to look.
+        # FlagMeta.__new__ puts it straight into the class namespace, so no MRO walk is needed.
+        flag_map = cls.__dict__.get('flag_map')
+
+        if flag_map is not None and name in flag_map:
+            return flag_map[name].resolve(cls)
+
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+    def clear_cache(cls):
+        """
+        Forgets every cached flag value, so the next read resolves it from the environment again.
+
+        If the flags are frozen, they are frozen again with the fresh values.
+        """
+
+        for flag in cls.flag_map.values():
+            flag._cached = _SENTINEL  # pylint: disable=protected-access
 
-        return super().__getattribute__(name)
+        if any(name in cls.__dict__ for name in cls.flag_map):
+            cls.freeze()
+
+    def resolve_all(cls) -> typing.Dict[str, typing.Any]:
+        """
+        Resolves every flag at once, returning a dictionary of flag names to their values.
+        """
+
+        return {name: flag.resolve(cls) for name, flag in cls.flag_map.items()}
+
+    def freeze(cls):
+        """
+        Resolves every flag from the current environment and stores the results
+        as plain class attributes, so later reads no longer go through flag resolution.
+
+        Assigning a flag afterwards still works. Later environment changes are only
+        picked up by calling this (or clear_cache) again.
+        """
+
+        # Drop any previously frozen and cached values first, as defaults may read other flags
+        for name, flag in cls.flag_map.items():
+            flag._cached = _SENTINEL  # pylint: disable=protected-access
+
+            if name in cls.__dict__:
+                super().__delattr__(name)
+
+        for name, value in cls.resolve_all().items():
+            super().__setattr__(name, value)
 
     def __setattr__(cls, name: str, value):
         if name in cls.flag_map:
@@ -131,6 +200,15 @@ class FlagMeta(type):
                 raise ValueError(f"Attempted to set flag {name} to type {type(value).__name__} (should be {flag.flag_type.__name__})")
 
             flag.override = value
+
+            # Callable defaults may depend on this flag, so drop their cached values
+            for other in cls.flag_map.values():
+                if other._default_callable:  # pylint: disable=protected-access
+                    other._cached = _SENTINEL  # pylint: disable=protected-access
+
+            # Frozen values shadow flag resolution, so they need refreshing too
+            if name in cls.__dict__:
+                cls.freeze()
         else:
             super().__setattr__(name, value)
 
@@ -143,6 +221,11 @@ class Flags(metaclass=FlagMeta):
         export JISHAKU_HIDE=1
     Or you can override them programmatically:
         jishaku.Flags.HIDE = True
+    Environment values are read once, on the first access of each flag. If you change them
+    from code after that, call this so they are read again:
+        jishaku.Flags.clear_cache()
+    Once configured, you can also freeze the flags so reading them is as cheap as a normal attribute:
+        jishaku.Flags.freeze()
     """
 
     # Flag to indicate the Jishaku base command group should be hidden
@@ -10,8 +10,7 @@ Meta information about jishaku.
 :license: MIT, see LICENSE for more details.
 
 """
-import importlib.metadata
-from collections import namedtuple
+import typing
 
 __all__ = (
     '__author__',
@@ -23,8 +22,20 @@ __all__ = (
     'version_info'
 )
 
+
+class VersionInfo(typing.NamedTuple):
+    """
+    Version information for jishaku, in the same shape as :data:`sys.version_info`.
+    """
+
+    major: int
+    minor: int
+    micro: int
+    releaselevel: str
+    serial: int
+
+
 # pylint: disable=invalid-name
-VersionInfo = namedtuple('VersionInfo', 'major minor micro releaselevel serial')
 version_info = VersionInfo(major=2, minor=6, micro=6, releaselevel='final', serial=0)
 
 __author__ = 'Gorialis, Kraots'
@@ -33,9 +44,3 @@ __docformat__ = 'restructuredtext en'
 __license__ = 'MIT'
 __title__ = 'jishaku'
 __version__ = '.'.join(map(str, (version_info.major, version_info.minor, version_info.micro)))
-
-# This ensures that when jishaku is reloaded, pkg_resources requeries it to provide correct version info
-try:
-    __version__ = importlib.metadata.version('jishaku')
-except importlib.metadata.PackageNotFoundError:
-    pass
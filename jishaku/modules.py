@@ -10,15 +10,20 @@ Functions for managing and searching modules.
 :license: MIT, see LICENSE for more details.
 
 """
+import functools
 import importlib.metadata
+import os
 import pathlib
+import sys
 import typing
 
-from braceexpand import UnbalancedBracesError, braceexpand
 from disnake.ext import commands
 
 __all__ = ('find_extensions_in', 'resolve_extensions', 'package_version', 'ExtensionConverter')
 
+_BRACE_SYMBOLS = frozenset('{}\\')
+_EXPANSION_SYMBOLS = _BRACE_SYMBOLS | frozenset('*~')
+
 
 def find_extensions_in(path: typing.Union[str, pathlib.Path]) -> list:
     """
@@ -31,25 +36,26 @@ def find_extensions_in(path: typing.Union[str, pathlib.Path]) -> list:
     if not path.is_dir():
         return []
 
-    extension_names = []
+    prefix = '.'.join(part for part in path.parts if part != '.')
+    if prefix:
+        prefix += '.'
 
-    # Find extensions directly in this folder
-    for subpath in path.glob('*.py'):
-        parts = subpath.with_suffix('').parts
-        if parts[0] == '.':
-            parts = parts[1:]
+    module_names = []
+    package_names = []
 
-        extension_names.append('.'.join(parts))
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
 
-    # Find extensions as subfolder modules
-    for subpath in path.glob('*/__init__.py'):
-        parts = subpath.parent.parts
-        if parts[0] == '.':
-            parts = parts[1:]
+            # Find extensions directly in this folder
+            if name.endswith('.py') and name != '__init__.py' and entry.is_file():
+                module_names.append(sys.intern(prefix + name[:-3]))
 
-        extension_names.append('.'.join(parts))
+            # Find extensions as subfolder modules
+            elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                package_names.append(sys.intern(prefix + name))
 
-    return extension_names
+    return module_names + package_names
 
 
 def resolve_extensions(bot: commands.Bot, name: str) -> list:
@@ -57,8 +63,16 @@ def resolve_extensions(bot: commands.Bot, name: str) -> list:
     Tries to resolve extension queries into a list of extension names.
     """
 
+    # Names without braces or escapes expand to themselves, so skip the parser
+    if _BRACE_SYMBOLS.isdisjoint(name):
+        candidates = (name,)
+    else:
+        from braceexpand import braceexpand  # pylint: disable=import-outside-toplevel
+
+        candidates = braceexpand(name)
+
     exts = []
-    for ext in braceexpand(name):
+    for ext in candidates:
         if ext.endswith('.*'):
             module_parts = ext[:-2].split('.')
             path = pathlib.Path(*module_parts)
@@ -71,9 +85,12 @@ def resolve_extensions(bot: commands.Bot, name: str) -> list:
     return exts
 
 
+@functools.lru_cache(maxsize=None)
 def package_version(package_name: str) -> typing.Optional[str]:
     """
     Returns package version as a string, or None if it couldn't be found.
+
+    Results are cached for the lifetime of the process.
     """
 
     try:
@@ -88,6 +105,12 @@ class ExtensionConverter(commands.Converter):
     """
 
     async def convert(self, ctx: commands.Context, argument) -> list:
+        # Plain extension names need no resolving at all
+        if _EXPANSION_SYMBOLS.isdisjoint(argument):
+            return [argument]
+
+        from braceexpand import UnbalancedBracesError  # pylint: disable=import-outside-toplevel
+
         try:
             return resolve_extensions(ctx.bot, argument)
         except UnbalancedBracesError as exc:
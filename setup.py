@@ -25,21 +25,25 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import ast
 import pathlib
-import re
 
 from setuptools import setup
 
 ROOT = pathlib.Path(__file__).parent
 
 with open(ROOT / 'jishaku' / 'meta.py', 'r', encoding='utf-8') as f:
-    VERSION_MATCH = re.search(r'VersionInfo\(major=(\d+), minor=(\d+), micro=(\d+), .+\)', f.read(), re.MULTILINE)
-
-    if not VERSION_MATCH:
+    for line in f:
+        if not line.startswith('version_info ='):
+            continue
+
+        VERSION_CALL = ast.parse(line.split('=', 1)[1].strip(), mode='eval').body
+        VERSION_PARTS = {keyword.arg: ast.literal_eval(keyword.value) for keyword in VERSION_CALL.keywords}
+        VERSION = '.'.join(str(VERSION_PARTS[part]) for part in ('major', 'minor', 'micro'))
+        break
+    else:
         raise RuntimeError('version is not set or could not be located')
 
-    VERSION = '.'.join([VERSION_MATCH.group(1), VERSION_MATCH.group(2), VERSION_MATCH.group(3)])
-
 EXTRA_REQUIRES = {}
 
 for feature in (ROOT / 'requirements').glob('*.txt'):